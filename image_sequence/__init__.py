@@ -12,27 +12,80 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import collections
+import functools
 import re
 import os
 
-try:
-    from os import scandir
-except ImportError:
-    from scandir import scandir
-
-
+__all__ = ["ImageSequence", "find_sequence_on_disk", "find_sequences_on_disk"]
 __version__ = "0.1.0"
 
 # fmt: off
 _RE_FILENAME = re.compile(
-    r"(?P<name>[\w\-\[\]]+)"      # File name.
-    r"(\.((?P<frame>\d+)|"        # Optional frame number.
-    r"(?:%0(?P<token>\d+)d)|"     # Optional frame token e.g %04d
-    r"(?P<udim><UDIM>)|"          # Optional udim token e.g <UDIM>
-    r"(?P<padding>[#@]+)))?"      # Optional padding e.g @@ or ###
-    r"(?P<ext>\.\w+(?:\.\w+)?)$"  # File extension.
+    r"(?P<name>[\w\-\[\]]+?)"           # File name.
+    r"(?:\.(?=[%<#@]|\d)"               # Only try the tokens below if one can start here.
+    r"(?:(?P<frame>\d+)|"               # Optional frame number.
+    r"%0(?P<token>\d+)d|"               # Optional frame token e.g %04d
+    r"(?P<udim><UDIM>)|"                # Optional udim token e.g <UDIM>
+    r"(?P<padding>[#@]+)))?"            # Optional padding e.g @@ or ###
+    r"(?P<ext>\.\w+(?:\.\w+)?)\Z"       # File extension.
 )
 # fmt: on
+_RE_MATCH = _RE_FILENAME.match
+
+_DEFAULT_PATTERN = "{name}{frame}{ext}"
+_FRAME_SENTINEL = "\0"  # Placeholder marking the frame number position in a path.
+
+# Pre-built boost style frame tokens for the most common paddings.
+_BOOST_CACHE = {n: ".%0{}d".format(n) for n in range(1, 11)}
+
+
+def _match_filename(basename):
+    """Match file name, skipping the regex engine for names without an extension.
+
+    Args:
+        basename (str): File name to match.
+
+    Returns:
+        re.Match: Match object or `None`.
+
+    """
+    return _RE_MATCH(basename) if "." in basename else None
+
+
+def _abstract_from_data(dirname_pfx, data):
+    """Build abstract path representation from parsed file name data.
+
+    Args:
+        dirname_pfx (str): Directory with trailing separator.
+        data (dict): Parsed file name data with `name` and `ext`.
+
+    Returns:
+        str: File path with `.$FRAME` in place of the frame token.
+
+    """
+    return dirname_pfx + data["name"] + ".$FRAME" + data["ext"]
+
+
+def _boost_token(padding):
+    """str: Boost style frame token e.g `.%04d` for padding."""
+    return _BOOST_CACHE.get(padding) or ".%0{}d".format(padding)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_basename(basename):
+    """Parse file name into its components. Results are cached per file name.
+
+    Args:
+        basename (str): File name to parse.
+
+    Returns:
+        dict: Matched groups of the file name or `None`. The dict is shared and must not be
+            modified.
+
+    """
+    match = _match_filename(basename)
+    return match.groupdict("") if match else None
 
 
 def find_sequence_on_disk(path):
@@ -52,9 +105,97 @@ def find_sequence_on_disk(path):
     return seq
 
 
+def find_sequences_on_disk(paths):
+    """Create ImageSequence objects for many paths and find their frames.
+
+    Paths are grouped by directory so every directory is only scanned once, and
+    directories are scanned in parallel.
+
+    Args:
+        paths (list[str]): File paths.
+
+    Returns:
+        list[ImageSequence]: Image sequence objects in the same order as `paths` (`None` for
+            paths that can't be parsed).
+
+    """
+    sequences = [ImageSequence.new(path) for path in paths]
+
+    by_dirname = collections.defaultdict(list)
+    for seq in sequences:
+        if seq and seq.dirname and seq._data.get("frame"):
+            by_dirname[seq.dirname].append(seq)
+
+    def scan(item):
+        dirname, dir_sequences = item
+        if os.path.exists(dirname):
+            _scan_frames(dirname, dir_sequences)
+
+    if by_dirname:
+        # Imported here since `concurrent.futures` pulls in `logging` and slows down module import.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(8, len(by_dirname))) as executor:
+            list(executor.map(scan, by_dirname.items()))
+
+    return sequences
+
+
+def _scan_frames(dirname, sequences):
+    """Scan directory once and add the frames of matching files to the sequences.
+
+    Args:
+        dirname (str): Directory to scan.
+        sequences (list[ImageSequence]): Sequences with frame tokens located in `dirname`.
+
+    """
+    # A file belongs to a sequence if its name is the text before and after the frame token of
+    # the abstract path with a frame number in between. Matching on those literals is a single
+    # pass that needs no regex and works for custom format patterns too.
+    targets = collections.defaultdict(list)
+    for seq in sequences:
+        parts = seq.abstract_path_representation()[len(seq._dirname_pfx) :].split(".$FRAME")
+        if len(parts) == 2:
+            targets[(parts[0] + ".", parts[1])].append(seq)
+
+    if not targets:
+        return
+
+    prefixes = tuple(prefix for prefix, _ in targets)
+    exts = tuple(ext for _, ext in targets)
+    found = collections.defaultdict(list)
+
+    with os.scandir(dirname) as it:
+        for entry in it:
+            # Cheap string checks to skip unrelated files before `is_file`, which may need a stat
+            # call when d_type is unknown.
+            name = entry.name
+            if not (name.startswith(prefixes) and name.endswith(exts)):
+                continue
+
+            for prefix, ext in targets:
+                if not (name.startswith(prefix) and name.endswith(ext)):
+                    continue
+
+                frame = name[len(prefix) : len(name) - len(ext)]
+                if frame.isdecimal() and entry.is_file():
+                    found[(prefix, ext)].append(frame)
+
+    # Convert the collected frame strings in one batch outside of the scan loop.
+    for key, frame_strings in found.items():
+        frames = list(map(int, frame_strings))
+        padding = max(map(len, frame_strings))
+        for seq in targets[key]:
+            seq._extend_frames(frames)
+            if padding > seq.padding:
+                seq.padding = padding
+
+
 class ImageSequence(object):
     """Class for representing a file sequence.
 
+    The class uses `__slots__` so arbitrary attributes can't be set on instances.
+
     Examples:
         >>>from image_sequence import ImageSequence
         >>>seq = ImageSequence("/mock/path/file_name.1001.exr")
@@ -66,20 +207,46 @@ class ImageSequence(object):
     BOOST_FORMAT_STYLE = "%"
     UDIM_STYLE = "<UDIM>"
 
+    # Frame token builders for the built in padding styles keyed by style.
+    _PADDING_FORMATS = {
+        BOOST_FORMAT_STYLE: _boost_token,
+        UDIM_STYLE: lambda padding: ".<UDIM>",
+    }
+
+    # Keeps instances small and attribute access fast when many sequences are created.
+    __slots__ = (
+        "_abs",
+        "_basename",
+        "_data",
+        "_dirname",
+        "_dirname_pfx",
+        "_frames",
+        "_int_fmt",
+        "_last_pad_key",
+        "_padding",
+        "_padding_style",
+        "_pattern",
+        "_split",
+        "_up_to_date",
+    )
+
     def __init__(self, path, padding_style=BOOST_FORMAT_STYLE):
         super(ImageSequence, self).__init__()
-        self._pattern = "{name}{frame}{ext}"
+        dirname, basename = os.path.split(path)
+        data = _parse_basename(basename)
+        self._pattern = _DEFAULT_PATTERN
+        self._invalidate()
+        self._last_pad_key = None
         self._frames = []
         self._up_to_date = True
         self._padding = 0
+        self._int_fmt = ""
         self._padding_style = padding_style  # This will be ignored if this is a udim.
-        self.dirname = os.path.dirname(path)
-
-        match = _RE_FILENAME.match(os.path.basename(path))
-        self._data = match.groupdict("") if match else {}
+        self.dirname = dirname
+        self._data = dict(data) if data else {}
 
         if self._data.get("frame"):
-            self.frames.append(int(self._data["frame"]))
+            self._append_frame(int(self._data["frame"]))
             self.padding = len(self._data["frame"])
         if self._data.get("udim"):
             self.padding_style = ImageSequence.UDIM_STYLE
@@ -90,10 +257,14 @@ class ImageSequence(object):
 
     @classmethod
     def new(cls, path, padding_style=BOOST_FORMAT_STYLE):
-        if _RE_FILENAME.match(os.path.basename(path)):
+        if _parse_basename(os.path.basename(path)):
             return cls(path, padding_style)
         return None
 
+    def _invalidate(self):
+        """Drop the cached path parts after the path data changed."""
+        self._abs = self._basename = self._split = None
+
     @property
     def padding(self):
         return self._padding
@@ -101,8 +272,11 @@ class ImageSequence(object):
     @padding.setter
     def padding(self, value):
         self._padding = value
+        self._int_fmt = "%0{}d".format(value) if value > 0 else ""
+        self._invalidate()
         if value < 1:
             self._data["frame"] = ""
+            self._last_pad_key = None
         else:
             self._create_padding_format()
 
@@ -126,18 +300,25 @@ class ImageSequence(object):
     @padding_style.setter
     def padding_style(self, value):
         self._padding_style = value
+        self._invalidate()
         if value == ImageSequence.UDIM_STYLE:
             self._padding = 4
+            self._int_fmt = "%04d"
 
         self._create_padding_format()
 
     def _create_padding_format(self):
-        if self.padding_style == ImageSequence.BOOST_FORMAT_STYLE:
-            self._data["frame"] = ".%0{}d".format(self._padding)
-        elif self._padding_style == ImageSequence.UDIM_STYLE:
-            self._data["frame"] = ".<UDIM>"
+        key = (self._padding_style, self._padding)
+        if key == self._last_pad_key:
+            return
+        self._last_pad_key = key
+        self._invalidate()
+
+        create_token = self._PADDING_FORMATS.get(self._padding_style)
+        if create_token:
+            self._data["frame"] = create_token(self._padding)
         else:
-            self._data["frame"] = "." + self.padding_style * self.padding
+            self._data["frame"] = "." + self._padding_style * self._padding
 
     def set_format(self, pattern):
         """Set format pattern.
@@ -147,11 +328,26 @@ class ImageSequence(object):
 
         """
         self._pattern = pattern
+        self._invalidate()
 
     @property
     def basename(self):
         """str: Base name of file path."""
-        return self._pattern.format(**self._data)
+        if self._basename is None:
+            self._basename = self._pattern.format_map(self._data)
+        return self._basename
+
+    @property
+    def dirname(self):
+        """str: Directory of file path."""
+        return self._dirname
+
+    @dirname.setter
+    def dirname(self, value):
+        self._dirname = value
+        # Cached directory prefix so paths can be built without calling `os.path.join`.
+        self._dirname_pfx = os.path.join(value, "") if value else ""
+        self._invalidate()
 
     @property
     def name(self):
@@ -161,6 +357,7 @@ class ImageSequence(object):
     @name.setter
     def name(self, value):
         self._data["name"] = value
+        self._invalidate()
 
     @property
     def ext(self):
@@ -170,18 +367,18 @@ class ImageSequence(object):
     @ext.setter
     def ext(self, value):
         self._data["ext"] = value
+        self._invalidate()
 
     @property
     def path(self):
         """str: File path without frame formatting."""
-        return os.path.join(self.dirname, self.basename)
+        return self._dirname_pfx + self.basename
 
     @property
     def frames(self):
         """list[int]: Frames in sequence."""
         if not self._up_to_date:
-            self._frames = list(set(self._frames))
-            self._frames.sort()
+            self._frames = sorted(set(self._frames))
             self._up_to_date = True
 
         return self._frames
@@ -189,7 +386,27 @@ class ImageSequence(object):
     @frames.setter
     def frames(self, value):
         self._up_to_date = False
-        self._frames = value
+        self._frames = list(value)
+
+    def _append_frame(self, frame):
+        """Add frame without triggering the sort and uniquify of the frame list.
+
+        Args:
+            frame (int): Frame number to add.
+
+        """
+        self._frames.append(frame)
+        self._up_to_date = False
+
+    def _extend_frames(self, frames):
+        """Add frames without triggering the sort and uniquify of the frame list.
+
+        Args:
+            frames (list[int]): Frame numbers to add.
+
+        """
+        self._frames.extend(frames)
+        self._up_to_date = False
 
     def merge(self, other):
         """Merge frame range and padding with other object.
@@ -198,10 +415,9 @@ class ImageSequence(object):
             other (ImageSequence): Object to merge with.
 
         """
-        self.frames += other.frames
+        self._extend_frames(other._frames)
         if other.padding > self.padding:
             self.padding = other.padding
-        self._up_to_date = False
 
     def get_paths(self, offset=0):
         """Get file paths for all frames.
@@ -213,11 +429,20 @@ class ImageSequence(object):
             list[str]: File paths for frame sequence.
 
         """
-        path = self._get_path_for_formatting()
-        if not self.frames:
-            return [path]
+        frames = self.frames
+        if not frames or not self._data.get("frame"):
+            return [self._get_path_for_formatting()]
+
+        split = self._split or self._cache_split()
+        if not split:
+            path = self._get_path_for_formatting()
+            return [path % (frame + offset) for frame in frames]
 
-        return [path % (frame + offset) for frame in self.frames]
+        prefix, suffix = split
+        fmt = self._int_fmt or "%d"
+        if offset:
+            return [prefix + fmt % (frame + offset) + suffix for frame in frames]
+        return [prefix + fmt % frame + suffix for frame in frames]
 
     def eval_at_frame(self, frame):
         """Evaluate file path at specefyed frame and return corresponding frame.
@@ -229,11 +454,29 @@ class ImageSequence(object):
             str: File path with specified frame.
 
         """
-        path = self._get_path_for_formatting()
-        if not self.padding:
-            return path
+        if not self._padding or not self._data.get("frame"):
+            return self._get_path_for_formatting()
+
+        split = self._split or self._cache_split()
+        if not split:
+            return self._get_path_for_formatting() % frame
+
+        prefix, suffix = split
+        return prefix + self._int_fmt % frame + suffix
+
+    def _cache_split(self):
+        """tuple(str, str): Compute and store the file path before and after the frame number.
 
-        return path % frame
+        `None` if the format pattern doesn't hold exactly one frame token.
+
+        """
+        # Split the path around the frame number once so only the number is formatted per frame.
+        path = self._format_with_frame_token("." + _FRAME_SENTINEL)
+        parts = path.split(_FRAME_SENTINEL)
+        if len(parts) != 2:
+            return None
+        self._split = tuple(parts)
+        return self._split
 
     def format_with_padding_style(self, style, padding=0):
         """Format path with custom padding type.
@@ -254,10 +497,8 @@ class ImageSequence(object):
             str: Formated file path.
 
         """
-        data = dict(self._data)
         padding_tokens = style * (padding if padding else self.padding)
-        data["frame"] = "." + padding_tokens if padding_tokens else ""
-        return os.path.join(self.dirname, self._pattern.format(**data))
+        return self._format_with_frame_token("." + padding_tokens if padding_tokens else "")
 
     def optional_frame_token_format(self, style):
         """Format path with custom padding type if padding is set.
@@ -281,10 +522,8 @@ class ImageSequence(object):
             str: Formatted file path.
 
         """
-        data = dict(self._data)
         padding_token = style if self.padding else ""
-        data["frame"] = ".{}".format(padding_token) if padding_token else ""
-        return os.path.join(self.dirname, self._pattern.format(**data))
+        return self._format_with_frame_token(".{}".format(padding_token) if padding_token else "")
 
     def set_custom_frame_token(self, token):
         """Set custom frame token e.g replace the frame number or symbols with a custom string.
@@ -296,6 +535,8 @@ class ImageSequence(object):
 
         """
         self._data["frame"] = "." + token if token else ""
+        self._last_pad_key = None
+        self._invalidate()
 
     def find_frames_on_disk(self):
         """bool: Try to find frames on disk. True if frames found else False."""
@@ -308,19 +549,7 @@ class ImageSequence(object):
         if not os.path.exists(self.dirname):
             return False
 
-        for path in scandir(self.dirname):
-            if not path.is_file():
-                continue
-
-            element = ImageSequence.new(path.path)
-
-            # Filter out file names that we can't parse.
-            if not element:
-                continue
-
-            if self.abstract_path_representation() == element.abstract_path_representation():
-                self.merge(element)
-
+        _scan_frames(self.dirname, [self])
         return bool(self.frames)
 
     @property
@@ -344,17 +573,48 @@ class ImageSequence(object):
 
     def abstract_path_representation(self):
         """str: File path without frame padding."""
-        return self.path.replace(self._data["frame"], ".$FRAME")
+        return self._abs or self._cache_abs()
+
+    def _cache_abs(self):
+        """str: Compute and store the abstract path representation."""
+        data = self._data
+        if not data.get("frame"):
+            self._abs = self.path
+        elif self._pattern == _DEFAULT_PATTERN:
+            self._abs = _abstract_from_data(self._dirname_pfx, data)
+        else:
+            self._abs = self._format_with_frame_token(".$FRAME")
+        return self._abs
 
     def _get_path_for_formatting(self):
         """str: File path prepared for optional frame formatting."""
-        data = dict(self._data)
-        if data.get("frame"):
-            data["frame"] = ".%0{}d".format(self.padding)
-        return os.path.join(self.dirname, self._pattern.format(**data))
+        frame = self._data.get("frame")
+        token = _boost_token(self._padding)
+        # Boost style sequences already carry the token, no need to swap it in.
+        if not frame or frame == token:
+            return self.path
+        return self._format_with_frame_token(token)
+
+    def _format_with_frame_token(self, token):
+        """Format file path with another frame token, leaving the path data untouched.
+
+        Args:
+            token (str): Frame token to use e.g `.####`.
+
+        Returns:
+            str: Formatted file path.
+
+        """
+        return self._dirname_pfx + self._pattern.format_map({**self._data, "frame": token})
 
     def __eq__(self, other):
-        return self.abstract_path_representation() == other.abstract_path_representation()
+        if not isinstance(other, ImageSequence):
+            return NotImplemented
+        return (self._abs or self._cache_abs()) == (other._abs or other._cache_abs())
+
+    def __hash__(self):
+        # Hash the same cached key `__eq__` compares so equal sequences hash equally.
+        return hash(self._abs or self._cache_abs())
 
     def __ne__(self, other):
         return not self == other
@@ -372,10 +632,19 @@ class ImageSequence(object):
         return True
 
     def __copy__(self):
-        obj = type(self)(self.path, padding_style=self.padding_style)
-        obj._padding = self.padding
-        obj.frames = self._frames
-        obj._pattern = self._pattern
+        # Copy the slots directly instead of parsing the path again. Strings and cached path parts
+        # are immutable and shared, only the mutable containers are copied.
+        cls = type(self)
+        obj = cls.__new__(cls)
+        # Include slots and attributes added by subclasses.
+        for klass in cls.__mro__:
+            for attr in klass.__dict__.get("__slots__", ()):
+                if hasattr(self, attr):
+                    setattr(obj, attr, getattr(self, attr))
+        if hasattr(self, "__dict__"):
+            obj.__dict__.update(self.__dict__)
+        obj._data = dict(self._data)
+        obj._frames = list(self._frames)
         return obj
 
     __nonzero__ = __bool__
@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import copy
+import pickle
+import shutil
+import tempfile
 import unittest
 import os
 
@@ -31,20 +34,70 @@ def mock_join(*args):
     return "/".join(args)
 
 
-@mock.patch("image_sequence.os.path.join", mock_join)
+_JOIN_PATCHER = mock.patch("image_sequence.os.path.join", mock_join)
+
+
+def setUpModule():
+    # Patch once for the whole module instead of wrapping every test method.
+    _JOIN_PATCHER.start()
+
+
+def tearDownModule():
+    _JOIN_PATCHER.stop()
+
+
 class TestImageSequence(unittest.TestCase):
+    # Built with `mock_join` since the sequences they are compared with are built while it is patched in.
+    EXPECTED_BUMP_PATHS = [mock_join(TEXTRUES_ROOT, "char_dog_BUMP.{}.exr".format(n)) for n in (1002, 1003)]
+    EXPECTED_DIFFUSE_PATHS = [mock_join(TEXTRUES_ROOT, "char_dog_DIFFUSE.{}.exr".format(n)) for n in (1001, 1002)]
+
+    @classmethod
+    def setUpClass(cls):
+        # Shared sequences, tests that modify them must work on a copy.
+        cls.sequences = {
+            path: image_sequence.ImageSequence(path)
+            for path in ("/mock/path/file_name.1001.exr", "/mock/file_name.101.exr")
+        }
+
     def test_add_frames(self):
         seq = image_sequence.ImageSequence("/mock/path/file_name.@@@.exr")
         seq.frames = [50, 10, 20, 30, 40, 40, 10]
         expected_result = [10, 20, 30, 40, 50]
         self.assertEqual(expected_result, seq.frames)
 
+    def test_append_frames_merge(self):
+        seq = image_sequence.ImageSequence("/mock/path/file_name.1001.exr")
+        seq.frames.append(1005)
+        other = image_sequence.ImageSequence("/mock/path/file_name.1002.exr")
+        seq.merge(other)
+
+        self.assertEqual([1001, 1002, 1005], seq.frames)
+
     def test_new_sucess(self):
         seq = image_sequence.ImageSequence.new("/mock/path/file.1001.exr")
         expected_result = "/mock/path/file.%04d.exr"
 
         self.assertEqual(expected_result, seq.path)
 
+    def test_new_subclass(self):
+        class Sub(image_sequence.ImageSequence):
+            __slots__ = ("tag",)
+
+            def __init__(self, path, padding_style=image_sequence.ImageSequence.BOOST_FORMAT_STYLE):
+                super(Sub, self).__init__(path, padding_style)
+                self.tag = "x"
+
+        seq = Sub.new("/mock/path/file.1001.exr")
+
+        self.assertEqual("x", seq.tag)
+
+    def test_new_non_ascii(self):
+        seq = image_sequence.ImageSequence.new("/mock/path/café.1001.exr")
+        expected_result = "/mock/path/café.%04d.exr"
+
+        self.assertEqual(expected_result, seq.path)
+        self.assertEqual([1001], seq.frames)
+
     def test_new010(self):
         seq = image_sequence.ImageSequence.new("/mock/file.1001.a#$")
         expected_result = None
@@ -106,27 +159,35 @@ class TestImageSequence(unittest.TestCase):
 
         self.assertEqual(expected_result, a == b)
 
+    def test_hash(self):
+        a = image_sequence.ImageSequence("/mock/path/file_name.101.exr")
+        b = image_sequence.ImageSequence("/mock/path/file_name.222.exr")
+        c = image_sequence.ImageSequence("/mock/path/other_name.101.exr")
+
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(2, len({a, b, c}))
+
     def test_set_format(self):
-        seq = image_sequence.ImageSequence("/mock/path/file_name.1001.exr")
+        seq = copy.copy(self.sequences["/mock/path/file_name.1001.exr"])
         seq.set_format("{name}{ext}{frame}")
         expected_result = "file_name.exr.%04d"
 
         self.assertEqual(expected_result, seq.basename)
 
     def test_basename(self):
-        seq = image_sequence.ImageSequence("/mock/path/file_name.1001.exr")
+        seq = self.sequences["/mock/path/file_name.1001.exr"]
         expected_result = "file_name.%04d.exr"
 
         self.assertEqual(expected_result, seq.basename)
 
     def test_dirname(self):
-        seq = image_sequence.ImageSequence("/mock/path/file_name.1001.exr")
+        seq = self.sequences["/mock/path/file_name.1001.exr"]
         expected_result = "/mock/path"
 
         self.assertEqual(expected_result, seq.dirname)
 
     def test_ext010(self):
-        seq = image_sequence.ImageSequence("/mock/path/file_name.1001.exr")
+        seq = self.sequences["/mock/path/file_name.1001.exr"]
         expected_result = ".exr"
 
         self.assertEqual(expected_result, seq.ext)
@@ -172,6 +233,20 @@ class TestImageSequence(unittest.TestCase):
 
         self.assertEqual(expected_result, seq.get_paths())
 
+    def test_get_paths_two_frame_tokens(self):
+        seq = image_sequence.ImageSequence("/mock/path/file.1001.exr")
+        seq.set_format("{name}{frame}/{name}{frame}{ext}")
+
+        self.assertRaises(TypeError, seq.get_paths)
+        self.assertRaises(TypeError, seq.eval_at_frame, 1001)
+
+    def test_get_paths_no_frame_token(self):
+        seq = image_sequence.ImageSequence("/mock/path/file.1001.exr")
+        seq.set_format("{name}{ext}")
+
+        self.assertRaises(TypeError, seq.get_paths)
+        self.assertRaises(TypeError, seq.eval_at_frame, 1001)
+
     def test_eval_at_frame010(self):
         seq = image_sequence.ImageSequence("/mock/file_name.%04d.exr")
         expected_result = "/mock/file_name.9999.exr"
@@ -182,15 +257,19 @@ class TestImageSequence(unittest.TestCase):
         expected_result = "/mock/file_name.exr"
         self.assertEqual(expected_result, seq.eval_at_frame(9999))
 
+    def test_find_frames_on_disk_custom_format(self):
+        seq = image_sequence.ImageSequence(os.path.join(TEXTRUES_ROOT, "char_dog.1002.exr"))
+        seq.set_format("{name}_BUMP{frame}{ext}")
+
+        self.assertTrue(seq.find_frames_on_disk())
+        self.assertEqual([1002, 1003], seq.frames)
+
     def test_find_frames_on_disk(self):
         path = os.path.join(TEXTRUES_ROOT, "char_dog_BUMP.%04d.exr")
 
         seq = image_sequence.ImageSequence(path)
 
-        expected_result = [
-            os.path.join(TEXTRUES_ROOT, "char_dog_BUMP.1002.exr"),
-            os.path.join(TEXTRUES_ROOT, "char_dog_BUMP.1003.exr"),
-        ]
+        expected_result = self.EXPECTED_BUMP_PATHS
 
         assert seq.find_frames_on_disk() == True
 
@@ -202,10 +281,7 @@ class TestImageSequence(unittest.TestCase):
 
         seq = image_sequence.ImageSequence(path)
 
-        expected_result = [
-            os.path.join(TEXTRUES_ROOT, "char_dog_BUMP.1002.exr"),
-            os.path.join(TEXTRUES_ROOT, "char_dog_BUMP.1003.exr"),
-        ]
+        expected_result = self.EXPECTED_BUMP_PATHS
 
         assert seq.find_frames_on_disk() == True
 
@@ -242,8 +318,45 @@ class TestImageSequence(unittest.TestCase):
 
         self.assertEqual(expected_result, new_seq.path)
 
+    def test_copy(self):
+        seq = image_sequence.ImageSequence("/mock/path/file.1001.exr")
+        seq.set_custom_frame_token("$F4")
+        new_seq = copy.copy(seq)
+        new_seq.frames.append(1002)
+
+        self.assertEqual("/mock/path/file.$F4.exr", new_seq.path)
+        self.assertEqual([1001, 1002], new_seq.frames)
+        self.assertEqual([1001], seq.frames)
+
+    def test_copy_subclass(self):
+        class Sub(image_sequence.ImageSequence):
+            __slots__ = ("tag",)
+
+        seq = Sub("/mock/path/file.1001.exr")
+        seq.tag = "x"
+        new_seq = copy.copy(seq)
+
+        self.assertEqual("x", new_seq.tag)
+        self.assertEqual("/mock/path/file.%04d.exr", new_seq.path)
+
+    def test_deepcopy(self):
+        seq = image_sequence.ImageSequence("/mock/path/file.1001.exr")
+        seq.frames = [1001, 1002]
+        new_seq = copy.deepcopy(seq)
+
+        self.assertEqual([1001, 1002], new_seq.frames)
+        self.assertEqual(seq.get_paths(), new_seq.get_paths())
+
+    def test_pickle(self):
+        seq = image_sequence.ImageSequence("/mock/path/file.1001.exr")
+        seq.frames = [1001, 1002]
+        new_seq = pickle.loads(pickle.dumps(seq))
+
+        self.assertEqual([1001, 1002], new_seq.frames)
+        self.assertEqual(seq.get_paths(), new_seq.get_paths())
+
     def test_format_with_padding_style(self):
-        seq = image_sequence.ImageSequence("/mock/file_name.101.exr")
+        seq = self.sequences["/mock/file_name.101.exr"]
         expected_result1 = "/mock/file_name.###.exr"
         expected_result2 = "/mock/file_name.@@@.exr"
         expected_result3 = "/mock/file_name.*.exr"
@@ -255,7 +368,7 @@ class TestImageSequence(unittest.TestCase):
         self.assertEqual(expected_result3, seq.format_with_padding_style("*", padding=1))
 
     def test_name(self):
-        seq = image_sequence.ImageSequence("/mock/file_name.101.exr")
+        seq = copy.copy(self.sequences["/mock/file_name.101.exr"])
         seq.name = "new_file_name"
 
         expected_result_path = "/mock/new_file_name.%03d.exr"
@@ -273,15 +386,12 @@ class TestImageSequence(unittest.TestCase):
 
     def test_abstract_path_representation_010(self):
         expected_result = "/mock/file_name.$FRAME.exr"
-        seq = image_sequence.ImageSequence("/mock/file_name.101.exr")
+        seq = self.sequences["/mock/file_name.101.exr"]
 
         self.assertEqual(expected_result, seq.abstract_path_representation())
 
     def test_find_sequence_on_disk_func(self):
-        expected_result = [
-            os.path.join(TEXTRUES_ROOT, "char_dog_DIFFUSE.1001.exr"),
-            os.path.join(TEXTRUES_ROOT, "char_dog_DIFFUSE.1002.exr"),
-        ]
+        expected_result = self.EXPECTED_DIFFUSE_PATHS
 
         path = os.path.join(TEXTRUES_ROOT, "char_dog_DIFFUSE.#.exr")
         seq = image_sequence.find_sequence_on_disk(path)
@@ -289,16 +399,59 @@ class TestImageSequence(unittest.TestCase):
         self.assertEqual(expected_result, seq.get_paths())
 
     def test_find_sequence_on_disk_func_udim(self):
-        expected_result = [
-            os.path.join(TEXTRUES_ROOT, "char_dog_DIFFUSE.1001.exr"),
-            os.path.join(TEXTRUES_ROOT, "char_dog_DIFFUSE.1002.exr"),
-        ]
+        expected_result = self.EXPECTED_DIFFUSE_PATHS
 
         path = os.path.join(TEXTRUES_ROOT, "char_dog_DIFFUSE.<UDIM>.exr")
         seq = image_sequence.find_sequence_on_disk(path)
 
         self.assertEqual(expected_result, seq.get_paths())
 
+    def test_find_sequences_on_disk_func(self):
+        paths = [
+            os.path.join(TEXTRUES_ROOT, "char_dog_BUMP.#.exr"),
+            os.path.join(TEXTRUES_ROOT, "char_dog_DIFFUSE.<UDIM>.exr"),
+            "/mock/file.1001.a#$",
+        ]
+        bump, diffuse, invalid = image_sequence.find_sequences_on_disk(paths)
+
+        self.assertEqual([1002, 1003], bump.frames)
+        self.assertEqual(4, bump.padding)
+        self.assertEqual([1001, 1002], diffuse.frames)
+        self.assertEqual(None, invalid)
+
+    def test_find_sequence_on_disk_symlinks(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        for frame in (1001, 1002):
+            source = os.path.join(root, "source.{}.exr".format(frame))
+            open(source, "w").close()
+            os.symlink(source, os.path.join(root, "shot.{}.exr".format(frame)))
+
+        seq = image_sequence.find_sequence_on_disk(os.path.join(root, "shot.####.exr"))
+
+        self.assertEqual([1001, 1002], seq.frames)
+
+    def test_find_sequences_on_disk_scans_once(self):
+        paths = [
+            os.path.join(TEXTRUES_ROOT, "char_dog_BUMP.#.exr"),
+            os.path.join(TEXTRUES_ROOT, "char_dog_DIFFUSE.#.exr"),
+        ]
+        with mock.patch("image_sequence.os.scandir", wraps=os.scandir) as scandir:
+            bump, diffuse = image_sequence.find_sequences_on_disk(paths)
+
+        self.assertEqual(1, scandir.call_count)
+        self.assertEqual([1002, 1003], bump.frames)
+        self.assertEqual([1001, 1002], diffuse.frames)
+
+    def test_find_sequence_on_disk_new_files(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        for frame in (1001, 1002, 1003):
+            open(os.path.join(root, "file.{}.exr".format(frame)), "w").close()
+            seq = image_sequence.find_sequence_on_disk(os.path.join(root, "file.####.exr"))
+
+            self.assertEqual(frame, seq.end)
+
     def test_start(self):
         seq = image_sequence.ImageSequence("/mock/file.###.exr")
         seq.frames = [103, 101, 102]